@@ -379,12 +379,21 @@ class NumberInputMixin:
         )
 
         if not int_args and not float_args:
+            # Only list the arguments that were actually passed, skipping None
+            # and the "min" sentinel. Note that falsy numbers like 0 and 0.0
+            # still count as passed.
+            arg_types = "".join(
+                f"\n`{arg_name}` has {type(arg).__name__} type."
+                for arg_name, arg in (
+                    ("value", value if value != "min" else None),
+                    ("min_value", min_value),
+                    ("max_value", max_value),
+                    ("step", step),
+                )
+                if arg is not None
+            )
             raise StreamlitAPIException(
-                "All numerical arguments must be of the same type."
-                f"\n`value` has {type(value).__name__} type."
-                f"\n`min_value` has {type(min_value).__name__} type."
-                f"\n`max_value` has {type(max_value).__name__} type."
-                f"\n`step` has {type(step).__name__} type."
+                f"All numerical arguments must be of the same type.{arg_types}"
             )
 
         session_state = get_session_state().filtered_state
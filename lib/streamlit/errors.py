@@ -14,6 +14,9 @@
 
 from __future__ import annotations
 
+import inspect
+import traceback
+
 from streamlit import util
 
 
@@ -113,11 +116,14 @@ class StreamlitAPIWarning(StreamlitAPIException, Warning):
 
     def __init__(self, *args):
         super().__init__(*args)
-        import inspect
-        import traceback
 
-        f = inspect.currentframe()
-        self.tacked_on_stack = traceback.extract_stack(f)
+        # Don't read source lines from disk here. FrameSummary looks them up
+        # lazily if the stack is ever formatted.
+        stack = traceback.StackSummary.extract(
+            traceback.walk_stack(inspect.currentframe()), lookup_lines=False
+        )
+        stack.reverse()
+        self.tacked_on_stack = stack
 
     def __repr__(self) -> str:
         return util.repr_(self)
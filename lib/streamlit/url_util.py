@@ -45,7 +45,7 @@ def process_gitblob_url(url: str) -> str:
         mdict = match.groupdict()
         # If it has "blob" in the url, replace this with "raw" and we're done.
         if mdict["blob_or_raw"] == "blob":
-            return "{base}{account}raw{suffix}".format(**mdict)
+            return "{base}{account}raw{suffix}".format_map(mdict)
 
         # If it is a "raw" url already, return untouched.
         if mdict["blob_or_raw"] == "raw":
@@ -105,6 +105,22 @@ SyntaxError: invalid syntax
         assert proto.message == _GENERIC_UNCAUGHT_EXCEPTION_TEXT
         assert proto.type == "AttributeError"
 
+    def test_api_warning_stack_trace(self):
+        """Test that StreamlitAPIWarnings carry the stack of the code that
+        created them, including source lines.
+        """
+        warning = errors.StreamlitAPIWarning("oh no!")
+
+        # Marshall it.
+        proto = ExceptionProto()
+        exception.marshall(proto, warning)
+
+        self.assertTrue(proto.is_warning)
+        self.assertIn("test_api_warning_stack_trace", proto.stack_trace[-1])
+        self.assertIn(
+            'warning = errors.StreamlitAPIWarning("oh no!")', proto.stack_trace[-1]
+        )
+
 
 class StExceptionAPITest(DeltaGeneratorTestCase):
     """Test Public Streamlit Public APIs."""
@@ -207,6 +207,26 @@ class NumberInputTest(DeltaGeneratorTestCase):
             with pytest.raises(StreamlitAPIException):
                 st.number_input("any label", value=3.14, format=fmt)
 
+    def test_error_on_mixed_types(self):
+        """Test that the error only lists the numerical arguments that were passed."""
+        with pytest.raises(StreamlitAPIException) as exc:
+            st.number_input("Label", value=0, max_value=10.5)
+        self.assertEqual(
+            "All numerical arguments must be of the same type."
+            "\n`value` has int type."
+            "\n`max_value` has float type.",
+            str(exc.value),
+        )
+
+        with pytest.raises(StreamlitAPIException) as exc:
+            st.number_input("Label", min_value=1, max_value=2.5)
+        self.assertEqual(
+            "All numerical arguments must be of the same type."
+            "\n`min_value` has int type."
+            "\n`max_value` has float type.",
+            str(exc.value),
+        )
+
     def test_value_out_of_bounds(self):
         # Max int
         with pytest.raises(StreamlitAPIException) as exc: